@@ -1,10 +1,12 @@
 import asyncio
 import logging
-from typing import Optional
+from typing import Dict, Optional, Set, Tuple
 
 import discord
 from discord.ext import commands
 
+from ttlmap import TTLMap
+
 log = logging.getLogger(__name__)
 
 # -----------------------
@@ -28,9 +30,19 @@ ALLOWED_ROLE_NAMES = {
 BTN_COMPLETE_CUSTOM_ID = "oops_broke_mark_complete_v1"
 BTN_PENDING_CUSTOM_ID = "oops_broke_mark_pending_v1"
 
+# How long to remember channels that turned out not to be tracked forum threads
+IGNORED_CHANNEL_TTL_SECONDS = 60.0
+IGNORED_CHANNEL_MAX_ENTRIES = 1024
+
+_ALLOWED_ROLE_NAMES_CF = frozenset(n.casefold() for n in ALLOWED_ROLE_NAMES)
+
+# forum channel id -> (pending tag id, complete tag id)
+# Invalidated by OopsSomethingBrokeCog.on_guild_channel_update when tags are edited.
+_forum_tag_cache: Dict[int, Tuple[Optional[int], Optional[int]]] = {}
+
+
 def _has_allowed_role(member: discord.Member) -> bool:
-    role_names = {r.name.casefold() for r in member.roles}
-    return any(name.casefold() in role_names for name in ALLOWED_ROLE_NAMES)
+    return any(r.name.casefold() in _ALLOWED_ROLE_NAMES_CF for r in member.roles)
 
 
 def _is_target_forum_thread(thread: discord.Thread) -> bool:
@@ -45,6 +57,19 @@ def _find_forum_tag(parent: discord.ForumChannel, name: str) -> Optional[discord
     return None
 
 
+def _get_status_tag_ids(parent: discord.ForumChannel) -> Tuple[Optional[int], Optional[int]]:
+    cached = _forum_tag_cache.get(parent.id)
+    if cached is None:
+        pending_tag = _find_forum_tag(parent, PENDING_TAG_NAME)
+        complete_tag = _find_forum_tag(parent, COMPLETE_TAG_NAME)
+        cached = (
+            pending_tag.id if pending_tag else None,
+            complete_tag.id if complete_tag else None,
+        )
+        _forum_tag_cache[parent.id] = cached
+    return cached
+
+
 async def _set_status_tag(thread: discord.Thread, *, status: str) -> bool:
     """
     status: "pending" or "complete"
@@ -55,10 +80,9 @@ async def _set_status_tag(thread: discord.Thread, *, status: str) -> bool:
 
     parent: discord.ForumChannel = thread.parent
 
-    pending_tag = _find_forum_tag(parent, PENDING_TAG_NAME)
-    complete_tag = _find_forum_tag(parent, COMPLETE_TAG_NAME)
+    pending_id, complete_id = _get_status_tag_ids(parent)
 
-    if pending_tag is None or complete_tag is None:
+    if pending_id is None or complete_id is None:
         log.warning(
             "Missing required forum tags in #%s (need '%s' and '%s').",
             getattr(parent, "name", "unknown"),
@@ -67,23 +91,27 @@ async def _set_status_tag(thread: discord.Thread, *, status: str) -> bool:
         )
         return False
 
-    keep_ids = {t.id for t in (thread.applied_tags or [])}
-    # Remove both status tags from the "keep" set
-    keep_ids.discard(pending_tag.id)
-    keep_ids.discard(complete_tag.id)
-
-    # Rebuild kept tags as ForumTag objects from parent.available_tags
-    kept_tags = [t for t in parent.available_tags if t.id in keep_ids]
-
     if status == "pending":
-        new_tags = kept_tags + [pending_tag]
+        target_id = pending_id
     elif status == "complete":
-        new_tags = kept_tags + [complete_tag]
+        target_id = complete_id
     else:
         raise ValueError("status must be 'pending' or 'complete'")
 
+    other_id = complete_id if target_id == pending_id else pending_id
+    applied_ids = {t.id for t in (thread.applied_tags or [])}
+
+    # Already in the requested state: skip the REST call entirely
+    if target_id in applied_ids and other_id not in applied_ids:
+        return True
+
+    # Keep the thread's other tags, drop both status tags, then add the target one
+    new_tag_ids = [i for i in applied_ids if i not in (pending_id, complete_id)]
+    new_tag_ids.append(target_id)
+
     try:
-        await thread.edit(applied_tags=new_tags)
+        # Thread.edit only serializes tag ids, so plain snowflakes avoid resolving ForumTag objects
+        await thread.edit(applied_tags=[discord.Object(id=i) for i in new_tag_ids])
         return True
     except discord.Forbidden:
         log.warning("Forbidden: cannot edit tags for thread %s. Check forum 'Manage Posts/Threads' perms.", thread.id)
@@ -177,8 +205,29 @@ class OopsMarkCompleteView(discord.ui.View):
 class OopsSomethingBrokeCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        # (guild_id, channel_id) of channels known not to be tracked threads
+        self._ignored_channels: TTLMap[Tuple[int, int], bool] = TTLMap(
+            IGNORED_CHANNEL_TTL_SECONDS, IGNORED_CHANNEL_MAX_ENTRIES
+        )
+        # Thread ids known to belong to the tracked forum (from creation or a previous lookup)
+        self._tracked_threads: Set[int] = set()
+        # Persistent (message-less) registration that handles clicks after restarts.
+        # Control messages get their own instances: sending a view re-keys it under that
+        # message, so a shared instance couldn't be cleanly removed on unload.
+        self._view = OopsMarkCompleteView()
+        self._bot_user_id: Optional[int] = None
+
+    async def cog_load(self) -> None:
+        # bot.user is populated by login, before extensions are loaded in setup_hook
+        self._bot_user_id = self.bot.user.id if self.bot.user else None
+
         # Register persistent view so old buttons keep working after restart. :contentReference[oaicite:6]{index=6}
-        self.bot.add_view(OopsMarkCompleteView())
+        # Done here (not __init__) so it pairs with cog_unload and reloads don't stack views.
+        self.bot.add_view(self._view)
+
+    async def cog_unload(self) -> None:
+        # Stopping a persistent view removes it from the bot's view store
+        self._view.stop()
 
     @commands.Cog.listener()
     async def on_thread_create(self, thread: discord.Thread):
@@ -186,6 +235,8 @@ class OopsSomethingBrokeCog(commands.Cog):
         if not _is_target_forum_thread(thread):
             return
 
+        self._tracked_threads.add(thread.id)
+
         # 1) Tag as Pending
         await _set_status_tag(thread, status="pending")
 
@@ -205,40 +256,61 @@ class OopsSomethingBrokeCog(commands.Cog):
         except discord.HTTPException as e:
             log.exception("HTTPException sending control message in thread %s: %s", thread.id, e)
 
+    @commands.Cog.listener()
+    async def on_guild_channel_update(self, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel):
+        # Forum tags may have been added/renamed/removed; drop the cached lookup
+        _forum_tag_cache.pop(after.id, None)
+
+    @commands.Cog.listener()
+    async def on_raw_thread_delete(self, payload: discord.RawThreadDeleteEvent):
+        self._tracked_threads.discard(payload.thread_id)
+
     @commands.Cog.listener()
     async def on_raw_reaction_add(self, payload: discord.RawReactionActionEvent):
         # Raw reaction events require Intents.reactions :contentReference[oaicite:8]{index=8}
-        if str(payload.emoji) != CHECK_EMOJI:
-            return
         if payload.guild_id is None:
             return
 
-        guild = self.bot.get_guild(payload.guild_id)
-        if guild is None:
+        # Only treat reactions on the starter message as "complete".
+        # For forum posts the starter message id is the thread (channel) id.
+        if payload.message_id != payload.channel_id:
+            return
+
+        tracked = payload.channel_id in self._tracked_threads
+        ignore_key = (payload.guild_id, payload.channel_id)
+        if not tracked and ignore_key in self._ignored_channels:
+            return
+
+        # Unicode emojis have no id and stringify to their name
+        if payload.emoji.id is not None or payload.emoji.name != CHECK_EMOJI:
             return
 
         # Ignore the bot's own reaction
-        if payload.user_id == self.bot.user.id:
+        if payload.user_id == self._bot_user_id:
+            return
+
+        guild = self.bot.get_guild(payload.guild_id)
+        if guild is None:
             return
 
         # The channel_id for a forum post reaction will be the thread channel
-        channel = guild.get_channel(payload.channel_id)
+        channel = guild.get_thread(payload.channel_id) if tracked else guild.get_channel_or_thread(payload.channel_id)
         if channel is None:
             try:
                 channel = await guild.fetch_channel(payload.channel_id)
+            except (discord.NotFound, discord.Forbidden):
+                self._ignored_channels.set(ignore_key, True)
+                return
             except discord.HTTPException:
+                # Transient (5xx/429): don't remember it, the next reaction retries
                 return
 
-        if not isinstance(channel, discord.Thread):
+        if not isinstance(channel, discord.Thread) or not _is_target_forum_thread(channel):
+            self._ignored_channels.set(ignore_key, True)
             return
 
+        self._tracked_threads.add(channel.id)
         thread: discord.Thread = channel
-        if not _is_target_forum_thread(thread):
-            return
-
-        # Only treat reactions on the starter message as "complete"
-        if payload.message_id != thread.id:
-            return
 
         member = payload.member
         if member is None:
@@ -1,19 +1,37 @@
+import asyncio
 import json
+import logging
+import unicodedata
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Dict, List, Mapping, NamedTuple, Optional, Tuple
 
 import discord
 from discord.ext import commands
 
 import config
 
+log = logging.getLogger(__name__)
 
-def _emoji_key(e: discord.PartialEmoji) -> str:
-    return str(e)
+# Alternate emojis mapped in emoji_to_role that are not added as initial reactions
+_VARIANT_ONLY_EMOJIS = frozenset({"🧜", "🧜‍♂️", "👯", "👯‍♂️"})
 
+# Reaction toggles from the same member within this window are applied as one role edit
+TOGGLE_DEBOUNCE_SECONDS = 0.25
 
-def _get_role(guild: discord.Guild, role_name: str) -> Optional[discord.Role]:
-    return discord.utils.get(guild.roles, name=role_name)
+# Audit log reasons for panel role edits
+_REASON_ADD = "Self-assigned via reaction role panel"
+_REASON_REMOVE = "Self-removed via reaction role panel"
+_REASON_UPDATE = "Self-updated via reaction role panel"
+
+
+class PanelSpec(NamedTuple):
+    key: str
+    title: str
+    description: str
+    field_name: str
+    field_value: str
+    emoji_to_role: Mapping[str, str]    # emoji name -> role_name
+    reaction_emojis: Tuple[str, ...]    # initial reactions, in display order
 
 
 class RoleAssignmentsCog(commands.Cog):
@@ -30,12 +48,17 @@ class RoleAssignmentsCog(commands.Cog):
         self.state_path = Path(getattr(config, "ROLE_PANEL_STATE_FILE", "data/role_panels.json"))
 
         self.panel_ids: Dict[str, int] = {}                  # panel_key -> message_id
-        self.message_to_map: Dict[int, Dict[str, str]] = {}  # message_id -> {emoji -> role_name}
+        self.message_to_map: Dict[int, Mapping[str, str]] = {}  # message_id -> {emoji name -> role_name}
+        self.message_role_ids: Dict[int, Dict[str, int]] = {}  # message_id -> {emoji name -> role_id}
+        self._role_cache: Dict[int, Dict[str, discord.Role]] = {}  # guild_id -> {role_name -> role}
+        # (guild_id, user_id) -> {role_id -> (role, add)}; latest desired state wins
+        self._pending_toggles: Dict[Tuple[int, int], Dict[int, Tuple[discord.Role, bool]]] = {}
+        self._bot_user_id: Optional[int] = None
 
         social_role_name = getattr(config, "ROLE_SOCIAL", "Social")
 
         # Panels (vertical lists everywhere: one field with newline-separated items)
-        self.panels: List[Dict] = [
+        panel_defs: List[Dict] = [
             {
                 "key": "updates",
                 "title": "Role Toggles — Updates",
@@ -122,23 +145,65 @@ class RoleAssignmentsCog(commands.Cog):
                 },
             },
         ]
+        self.panels_by_key: Dict[str, PanelSpec] = {}
+        self._panel_embeds: Dict[str, discord.Embed] = {}  # panel_key -> embed
+        for p in panel_defs:
+            # NFC-normalize keys once so composed/decomposed forms of a reaction both match
+            emoji_to_role = {unicodedata.normalize("NFC", e): r for e, r in p["emoji_to_role"].items()}
+            spec = PanelSpec(
+                **{**p, "emoji_to_role": emoji_to_role},
+                # Variant-only emojis are mapped but not added as initial reactions
+                reaction_emojis=tuple(e for e in emoji_to_role if e not in _VARIANT_ONLY_EMOJIS),
+            )
+            self.panels_by_key[spec.key] = spec
+            # Panel content is static, so embeds are built once here
+            self._panel_embeds[spec.key] = self._build_embed(spec)
 
         self._load_state()
 
+    async def cog_load(self) -> None:
+        # bot.user is populated by login, before extensions are loaded in setup_hook
+        self._bot_user_id = self.bot.user.id if self.bot.user else None
+
     # -------------------- State persistence --------------------
 
     def _save_state(self) -> None:
         self.state_path.parent.mkdir(parents=True, exist_ok=True)
-        payload = {"panel_ids": self.panel_ids}
-        self.state_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        payload = {
+            "panel_ids": self.panel_ids,
+            # JSON object keys must be strings
+            "emoji_to_role_id": {str(mid): ids for mid, ids in self.message_role_ids.items()},
+        }
+        # Write to a sibling temp file and swap it in so a crash never leaves a truncated file
+        tmp = self.state_path.with_suffix(self.state_path.suffix + ".tmp")
+        tmp.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        tmp.replace(self.state_path)
+
+    def _set_panel_ids(self, panel_ids: Dict[str, int]) -> bool:
+        """Update panel ids and the lookup map in place. Returns False if nothing changed (no save needed)."""
+        if panel_ids == self.panel_ids:
+            return False
+
+        # Only touch entries whose message id actually changed
+        for key, old_id in self.panel_ids.items():
+            if panel_ids.get(key) != old_id:
+                self.message_to_map.pop(old_id, None)
+        for key, new_id in panel_ids.items():
+            if self.panel_ids.get(key) != new_id:
+                panel = self.panels_by_key.get(key)
+                if panel is not None:
+                    self.message_to_map[new_id] = panel.emoji_to_role
+
+        self.panel_ids = panel_ids
+        return True
 
     def _rebuild_message_map(self) -> None:
         self.message_to_map = {}
-        by_key = {p["key"]: p for p in self.panels}
         for key, msg_id in self.panel_ids.items():
-            panel = by_key.get(key)
-            if panel:
-                self.message_to_map[int(msg_id)] = dict(panel["emoji_to_role"])
+            panel = self.panels_by_key.get(key)
+            if panel is not None:
+                # Panels are static after __init__, so share the mapping instead of copying it
+                self.message_to_map[int(msg_id)] = panel.emoji_to_role
 
     def _load_state(self) -> None:
         if not self.state_path.exists():
@@ -147,87 +212,178 @@ class RoleAssignmentsCog(commands.Cog):
         try:
             raw = self.state_path.read_text(encoding="utf-8").strip()
             if not raw:
-                self.panel_ids = {}
-                self._save_state()
-                self._rebuild_message_map()
+                # Nothing to load; the file is written once panels are posted
                 return
 
             data = json.loads(raw)
             self.panel_ids = {k: int(v) for k, v in (data.get("panel_ids") or {}).items()}
+            # Missing on state files written before role ids were stored; toggles then resolve by name
+            self.message_role_ids = {
+                int(mid): {e: int(rid) for e, rid in (ids or {}).items()}
+                for mid, ids in (data.get("emoji_to_role_id") or {}).items()
+            }
 
         except Exception as e:
-            print(f"[ROLES] Failed to load state file: {e}")
+            log.warning("Failed to load state file: %s", e)
             self.panel_ids = {}
-            try:
-                self._save_state()
-            except Exception:
-                pass
+            self.message_role_ids = {}
+            # Leave the unreadable file alone; the next !post_role_panels replaces it
 
         self._rebuild_message_map()
 
     # -------------------- Embed builder --------------------
 
-    def _build_embed(self, panel: Dict) -> discord.Embed:
+    def _build_embed(self, panel: PanelSpec) -> discord.Embed:
         embed = discord.Embed(
-            title=panel["title"],
-            description=panel["description"],
+            title=panel.title,
+            description=panel.description,
         )
         embed.add_field(
-            name=panel["field_name"],
-            value=panel["field_value"] or "\u2009",
+            name=panel.field_name,
+            value=panel.field_value or "\u2009",
             inline=False,  # force vertical layout everywhere
         )
         embed.set_footer(text="Add/remove your reaction to toggle the role.")
         return embed
 
+    # -------------------- Role lookup cache --------------------
+
+    def _get_role(self, guild: discord.Guild, role_name: str) -> Optional[discord.Role]:
+        roles = self._role_cache.get(guild.id)
+        if roles is None:
+            roles = {}
+            # First match wins, same as discord.utils.get on guild.roles
+            for r in guild.roles:
+                roles.setdefault(r.name, r)
+            self._role_cache[guild.id] = roles
+        return roles.get(role_name)
+
+    def _resolve_role_ids(self, guild: discord.Guild, panel: PanelSpec) -> Dict[str, int]:
+        role_ids: Dict[str, int] = {}
+        for emoji, role_name in panel.emoji_to_role.items():
+            role = self._get_role(guild, role_name)
+            if role is not None:
+                role_ids[emoji] = role.id
+        return role_ids
+
+    @commands.Cog.listener()
+    async def on_guild_role_create(self, role: discord.Role) -> None:
+        self._role_cache.pop(role.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role) -> None:
+        self._role_cache.pop(after.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role) -> None:
+        self._role_cache.pop(role.guild.id, None)
+
     # -------------------- Role toggling --------------------
 
     async def _toggle_role(self, payload: discord.RawReactionActionEvent, add: bool) -> None:
-        if payload.guild_id is None:
-            return
-
+        # Most reactions are on unrelated messages, so test the panel map first
         emoji_map = self.message_to_map.get(payload.message_id)
-        if not emoji_map:
-            return
-
-        if self.bot.user and payload.user_id == self.bot.user.id:
+        if not emoji_map or payload.guild_id is None:
             return
 
-        emoji = _emoji_key(payload.emoji)
+        # Panel emojis are unicode, which Discord sends as the emoji name itself.
+        # ASCII names (custom emojis) can't need normalization, so skip it for them.
+        emoji = payload.emoji.name
+        if emoji and not emoji.isascii():
+            emoji = unicodedata.normalize("NFC", emoji)
         role_name = emoji_map.get(emoji)
         if not role_name:
             return
 
+        if payload.user_id == self._bot_user_id:
+            return
+
         guild = self.bot.get_guild(payload.guild_id)
         if guild is None:
             return
 
-        role = _get_role(guild, role_name)
+        # Prefer the id resolved when the panel was posted; fall back to the name lookup
+        # if it's unknown or the role has since been deleted.
+        role = None
+        role_id = self.message_role_ids.get(payload.message_id, {}).get(emoji)
+        if role_id is not None:
+            role = guild.get_role(role_id)
+        if role is None:
+            role = self._get_role(guild, role_name)
         if role is None:
-            print(f"[ROLES] Role not found: {role_name!r} (emoji={emoji!r})")
+            log.warning("Role not found: %r (emoji=%r)", role_name, emoji)
             return
 
-        try:
-            member = guild.get_member(payload.user_id)
-            if member is None:
-                member = await guild.fetch_member(payload.user_id)
-        except (discord.NotFound, discord.Forbidden):
-            return
-        except discord.HTTPException as e:
-            print(f"[ROLES] fetch_member failed: {e}")
+        # Coalesce bursts: if an edit is already scheduled or in flight for this member, just
+        # record the latest desired state for this role and let that task pick it up.
+        key = (guild.id, payload.user_id)
+        pending = self._pending_toggles.get(key)
+        if pending is not None:
+            pending[role.id] = (role, add)
             return
 
+        pending = self._pending_toggles[key] = {role.id: (role, add)}
+        member: Optional[discord.Member] = None
+        try:
+            # The entry stays registered until the last edit has finished. Member.edit doesn't
+            # update the cache (the gateway event does, later), so each round builds on the
+            # member the previous edit returned instead of starting over from stale roles.
+            while pending:
+                await asyncio.sleep(TOGGLE_DEBOUNCE_SECONDS)
+                changes = dict(pending)
+                pending.clear()
+                # payload.member is only populated for reaction adds; removes rely on the cache
+                member = await self._apply_toggles(
+                    guild, payload.user_id, changes, fallback_member=payload.member, member=member
+                )
+        finally:
+            self._pending_toggles.pop(key, None)
+
+    async def _apply_toggles(
+        self,
+        guild: discord.Guild,
+        user_id: int,
+        changes: Dict[int, Tuple[discord.Role, bool]],
+        fallback_member: Optional[discord.Member] = None,
+        member: Optional[discord.Member] = None,
+    ) -> Optional[discord.Member]:
+        """
+        Apply a batch of role toggles in one edit. `member`, if given, is the result of the
+        previous edit in this burst. Returns the member with the roles as last known.
+        """
+        # With the members intent and guild chunking (see main.py) the member cache is
+        # complete, so a miss means the user has left; no fetch_member round-trip.
+        member = member or guild.get_member(user_id) or fallback_member
+        if member is None:
+            log.debug("Member %s not in cache for guild %s; ignoring reaction", user_id, guild.id)
+            return None
+
+        # Modify Guild Member with the full role list: one PATCH per debounce window.
+        # @everyone is implicit and must not be sent.
+        # Member.get_role checks the member's sorted role-id list without building member.roles
+        to_add = [r for rid, (r, add) in changes.items() if add and member.get_role(rid) is None]
+        remove_ids = {rid for rid, (_, add) in changes.items() if not add and member.get_role(rid) is not None}
+        if not to_add and not remove_ids:
+            return member
+
+        new_roles = [r for r in member.roles if not r.is_default() and r.id not in remove_ids] + to_add
+        if not remove_ids:
+            reason = _REASON_ADD
+        elif not to_add:
+            reason = _REASON_REMOVE
+        else:
+            reason = _REASON_UPDATE
+
         try:
-            if add:
-                if role not in member.roles:
-                    await member.add_roles(role, reason="Self-assigned via reaction role panel")
-            else:
-                if role in member.roles:
-                    await member.remove_roles(role, reason="Self-removed via reaction role panel")
+            edited = await member.edit(roles=new_roles, reason=reason)
         except discord.Forbidden:
-            print("[ROLES] Missing Manage Roles or role hierarchy prevents role change.")
+            log.warning("Missing Manage Roles or role hierarchy prevents role change.")
         except discord.HTTPException as e:
-            print(f"[ROLES] Role update failed: {e}")
+            log.warning("Role update failed: %s", e)
+        else:
+            if edited is not None:
+                return edited
+        return member
 
     @commands.Cog.listener()
     async def on_raw_reaction_add(self, payload: discord.RawReactionActionEvent) -> None:
@@ -250,24 +406,33 @@ class RoleAssignmentsCog(commands.Cog):
             return
 
         new_panel_ids: Dict[str, int] = {}
+        new_role_ids: Dict[int, Dict[str, int]] = {}
+
+        # Panels are sent one at a time so they appear in the channel in order
+        posted: List[Tuple[discord.Message, PanelSpec]] = []
+        for panel in self.panels_by_key.values():
+            msg = await ctx.channel.send(embed=self._panel_embeds[panel.key])
+            new_panel_ids[panel.key] = msg.id
+            new_role_ids[msg.id] = self._resolve_role_ids(ctx.guild, panel)
+            posted.append((msg, panel))
+
+        # Add initial reactions for every panel in one batch.
+        # discord.py queues same-bucket requests in order, so reaction order is preserved.
+        reactions = [(msg, emoji) for msg, panel in posted for emoji in panel.reaction_emojis]
+        results = await asyncio.gather(
+            *(msg.add_reaction(emoji) for msg, emoji in reactions),
+            return_exceptions=True,
+        )
+        for (msg, emoji), result in zip(reactions, results):
+            if isinstance(result, discord.HTTPException):
+                log.warning("Failed to add reaction %r on %s: %s", emoji, msg.id, result)
+            elif isinstance(result, BaseException):
+                raise result
 
-        for panel in self.panels:
-            embed = self._build_embed(panel)
-            msg = await ctx.channel.send(embed=embed)
-            new_panel_ids[panel["key"]] = msg.id
-
-            # Add initial reactions (skip variant-only emojis)
-            for emoji in panel["emoji_to_role"].keys():
-                if emoji in ("🧜", "🧜‍♂️", "👯", "👯‍♂️"):
-                    continue
-                try:
-                    await msg.add_reaction(emoji)
-                except discord.HTTPException as e:
-                    print(f"[ROLES] Failed to add reaction {emoji!r} on {msg.id}: {e}")
-
-        self.panel_ids = new_panel_ids
-        self._save_state()
-        self._rebuild_message_map()
+        self.message_role_ids = new_role_ids
+        if self._set_panel_ids(new_panel_ids):
+            # Serialize and write off the event loop so reaction handlers aren't stalled
+            await asyncio.to_thread(self._save_state)
 
         await ctx.send("Posted role panels (vertical embeds) and added reactions.", delete_after=10)
 
@@ -283,31 +448,33 @@ class RoleAssignmentsCog(commands.Cog):
             await ctx.send(f"Run this in #{self.roles_channel_name}.", delete_after=10)
             return
 
-        by_key = {p["key"]: p for p in self.panels}
         missing: List[str] = []
+        targets: List[Tuple[str, int, PanelSpec]] = []
 
-        for key, panel in by_key.items():
+        for key, panel in self.panels_by_key.items():
             msg_id = self.panel_ids.get(key)
             if not msg_id:
                 missing.append(key)
                 continue
+            targets.append((key, int(msg_id), panel))
+
+        # Edit via partial messages: no fetch round-trip is needed to edit our own
+        # messages, and a deleted panel still surfaces as NotFound.
+        results = await asyncio.gather(
+            *(
+                ctx.channel.get_partial_message(msg_id).edit(embed=self._panel_embeds[panel.key])
+                for _, msg_id, panel in targets
+            ),
+            return_exceptions=True,
+        )
 
-            try:
-                msg = await ctx.channel.fetch_message(int(msg_id))
-            except discord.NotFound:
+        for (key, msg_id, _), result in zip(targets, results):
+            if isinstance(result, discord.NotFound):
                 missing.append(key)
-                continue
-            except discord.Forbidden:
-                await ctx.send("I need Read Message History in this channel to sync panels.", delete_after=10)
-                return
-            except discord.HTTPException as e:
-                print(f"[ROLES] fetch_message failed for {key} ({msg_id}): {e}")
-                continue
-
-            try:
-                await msg.edit(embed=self._build_embed(panel))
-            except discord.HTTPException as e:
-                print(f"[ROLES] Failed to edit panel {key} ({msg.id}): {e}")
+            elif isinstance(result, discord.HTTPException):
+                log.warning("Failed to edit panel %s (%s): %s", key, msg_id, result)
+            elif isinstance(result, BaseException):
+                raise result
 
         if missing:
             await ctx.send(
@@ -1,16 +1,24 @@
 import asyncio
 import base64
+import contextlib
 import datetime as dt
 import json
+import logging
 import re
+import time
 from pathlib import Path
-from typing import Optional, Dict, Any, Tuple, List
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Tuple, List, Mapping, Set
 
 import aiohttp
 import discord
 from discord.ext import commands, tasks
 
 import config
+from pacing import Pacer
+from ttlmap import TTLMap
+
+log = logging.getLogger(__name__)
 
 
 # -------------------- constants / season logic --------------------
@@ -27,6 +35,18 @@ REVERIFY_DEADLINE_DAY = 14
 DM_ANNOUNCE_TIME_UTC = dt.time(hour=16, minute=0, tzinfo=UTC)   # April 1, 16:00 UTC
 ENFORCE_TIME_UTC = dt.time(hour=7, minute=5, tzinfo=UTC)        # April 7, 00:05 UTC
 
+# Role names, resolved from config once at import
+ROLE_SOCIAL_NAME = getattr(config, "ROLE_SOCIAL", "social")
+ROLE_SWABBIE_NAME = getattr(config, "ROLE_SWABBIE", "swabbie")
+ROLE_PAST_MEMBER_NAME = getattr(config, "ROLE_PAST_MEMBER", "past member")
+
+# WA membership level -> (role to add, role to remove) on successful verification
+LEVEL_ROLE_PLAN: Dict[str, Tuple[str, str]] = {
+    "Social": (ROLE_SOCIAL_NAME, ROLE_SWABBIE_NAME),
+    "General Member": (ROLE_SWABBIE_NAME, ROLE_SOCIAL_NAME),
+    "UBC Student": (ROLE_SWABBIE_NAME, ROLE_SOCIAL_NAME),
+}
+
 REVERIFY_DM_TEXT = (
     "Ahoy! A new membership season has begun (April 1–March 31).\n\n"
     "• **If you have already renewed** (or renew on the club website at https://ubcsailing.org/ before April 14), you are all set! The bot (me!) will automatically check your status on April 14, renew your verification, and keep your existing roles intact (which you can manage in {roles_channel})—no manual action is needed.\n"
@@ -34,10 +54,48 @@ REVERIFY_DM_TEXT = (
 )
 
 
+# Season DMs in flight at once, and the overall send rate shared by all of them
+SEASON_DM_CONCURRENCY = 10
+SEASON_DM_RATE_PER_SEC = 5.0
+
+# Records processed at once during enforcement, and the member fetch/role edit rate
+ENFORCE_CONCURRENCY = 16
+ENFORCE_MEMBER_RATE_PER_SEC = 2.0
+
+# WildApricot lookups during enforcement are bounded by ENFORCE_CONCURRENCY and the
+# client's per-host connection limit; a failed lookup is retried before giving up
+WA_LOOKUP_ATTEMPTS = 3
+WA_LOOKUP_RETRY_DELAY_SECONDS = 2.0
+
+# How long a fetched WildApricot contact is reused (retries, enforcement scans)
+WA_CONTACT_CACHE_TTL_SECONDS = 60.0
+WA_CONTACT_CACHE_MAX_ENTRIES = 5000
+
+# How long a fetch_member presence result is reused for unchunked guilds
+MEMBER_PRESENCE_TTL_SECONDS = 30.0
+MEMBER_PRESENCE_MAX_ENTRIES = 1024
+
+# Debounce for VerifiedRegistry's background writer, and its interval inside bulk()
+REGISTRY_FLUSH_DELAY_SECONDS = 0.25
+REGISTRY_BULK_CHECKPOINT_SECONDS = 5.0
+
+
 def _utcnow() -> dt.datetime:
     return dt.datetime.now(tz=UTC)
 
 
+_iso_now_cache: Tuple[int, str] = (0, "")
+
+
+def _iso_now() -> str:
+    """Current UTC time as the registry's "...Z" ISO string, rebuilt at most once per second."""
+    global _iso_now_cache
+    sec = int(time.time())
+    if _iso_now_cache[0] != sec:
+        _iso_now_cache = (sec, dt.datetime.fromtimestamp(sec, tz=UTC).isoformat().replace("+00:00", "Z"))
+    return _iso_now_cache[1]
+
+
 def _season_start_utc(year: int) -> dt.datetime:
     return dt.datetime(year, SEASON_START_MONTH, SEASON_START_DAY, 0, 0, 0, tzinfo=UTC)
 
@@ -65,17 +123,65 @@ def _parse_utc_iso(s: Optional[str]) -> Optional[dt.datetime]:
         return None
 
 
+def _verified_since(value: Any, start: dt.datetime, start_iso: str) -> bool:
+    """
+    True if a stored "...Z" timestamp is at or after start. Timestamps written by
+    _iso_now() are fixed-width UTC, so they compare correctly as plain strings.
+    """
+    if isinstance(value, str) and len(value) == len(start_iso) and value.endswith("Z"):
+        return value >= start_iso
+    parsed = _parse_utc_iso(value)
+    return parsed is not None and parsed >= start
+
+
 # -------------------- helpers --------------------
 
+_NORM_PUNCT = re.compile(r"[^a-z0-9\s]+")
+_NORM_SPACE = re.compile(r"\s+")
+
+
 def _norm_name(s: str) -> str:
     s = (s or "").strip().lower()
-    s = re.sub(r"[^a-z0-9\s]+", " ", s)   # drop punctuation
-    s = re.sub(r"\s+", " ", s).strip()
+    s = _NORM_PUNCT.sub(" ", s)   # drop punctuation
+    s = _NORM_SPACE.sub(" ", s).strip()
     return s
 
 
+# guild id -> {role name -> role id}, built from one pass over guild.roles.
+# Invalidated by VerifyCog's on_guild_role_* listeners.
+_role_id_cache: Dict[int, Dict[str, int]] = {}
+
+
 def _get_role(guild: discord.Guild, role_name: str) -> Optional[discord.Role]:
-    return discord.utils.get(guild.roles, name=role_name)
+    by_name = _role_id_cache.get(guild.id)
+    if by_name is None:
+        by_name = {}
+        for r in guild.roles:
+            # First match wins, same as discord.utils.get on duplicate names
+            by_name.setdefault(r.name, r.id)
+        _role_id_cache[guild.id] = by_name
+    rid = by_name.get(role_name)
+    return guild.get_role(rid) if rid is not None else None
+
+
+def _field_values(contact: Dict[str, Any]) -> Dict[str, Any]:
+    # Lowercased FieldName -> Value; the first occurrence wins, like a linear scan would
+    fvs: Dict[str, Any] = {}
+    for fv in contact.get("FieldValues", []) or []:
+        fvs.setdefault((fv.get("FieldName") or "").strip().lower(), fv.get("Value"))
+    return fvs
+
+
+def _membership_status_and_level(contact: Dict[str, Any]) -> Tuple[Optional[str], Optional[str]]:
+    """Status and level from the contact's top-level fields, falling back to its FieldValues."""
+    status = contact.get("Status")
+    ml = contact.get("MembershipLevel")
+    membership_level = ml.get("Name") if isinstance(ml, dict) else None
+    if not status or not membership_level:
+        fvs = _field_values(contact)
+        status = status or fvs.get("membership status")
+        membership_level = membership_level or fvs.get("membership level")
+    return status, membership_level
 
 
 def _bot_member(guild: discord.Guild, bot: commands.Bot) -> Optional[discord.Member]:
@@ -126,15 +232,9 @@ async def _apply_discord_updates(
 
     # --- nickname (Discord limit is 32 chars) ---
     new_nick = (wa_full or "").strip()[:32] or None
-    try:
-        await member.edit(nick=new_nick, reason="Verified via WildApricot")
-    except (discord.Forbidden, discord.HTTPException):
-        pass
 
     # --- roles ---
-    role_social = _get_role(guild, getattr(config, "ROLE_SOCIAL", "social"))
-    role_swabbie = _get_role(guild, getattr(config, "ROLE_SWABBIE", "swabbie"))
-    role_past_member = _get_role(guild, getattr(config, "ROLE_PAST_MEMBER", "past member"))
+    role_past_member = _get_role(guild, ROLE_PAST_MEMBER_NAME)
 
     level = (membership_level or "").strip()
 
@@ -148,20 +248,16 @@ async def _apply_discord_updates(
         if bot_m is None or _can_manage_role(bot_m, role_past_member):
             remove_roles.append(role_past_member)
 
-    if level == "Social":
-        if role_social and (bot_m is None or _can_manage_role(bot_m, role_social)):
-            add_roles.append(role_social)
-        if role_swabbie and role_swabbie in member.roles and (bot_m is None or _can_manage_role(bot_m, role_swabbie)):
-            remove_roles.append(role_swabbie)
-    elif level in ("General Member", "UBC Student"):
-        if role_swabbie and (bot_m is None or _can_manage_role(bot_m, role_swabbie)):
-            add_roles.append(role_swabbie)
-        if role_social and role_social in member.roles and (bot_m is None or _can_manage_role(bot_m, role_social)):
-            remove_roles.append(role_social)
+    plan = LEVEL_ROLE_PLAN.get(level)
+    if plan:
+        role_add, role_remove = _get_role(guild, plan[0]), _get_role(guild, plan[1])
+        if role_add and (bot_m is None or _can_manage_role(bot_m, role_add)):
+            add_roles.append(role_add)
+        if role_remove and role_remove in member.roles and (bot_m is None or _can_manage_role(bot_m, role_remove)):
+            remove_roles.append(role_remove)
 
     # --- restore old roles ---
-    wa_records = await registry.list_wa_records(guild.id)
-    rec = wa_records.get(str(wa_contact_id))
+    rec = await registry.get_wa_record(guild.id, wa_contact_id)
     if rec and rec.get("restorable_role_ids"):
         for rid in rec.get("restorable_role_ids", []):
             role = guild.get_role(rid)
@@ -175,12 +271,29 @@ async def _apply_discord_updates(
     # Only add roles the member doesn't already have
     actual_add_roles = [r for r in add_roles if r not in member.roles]
 
+    # Nickname and full role set in one Modify Guild Member call (@everyone is implicit),
+    # sending only what differs; a re-verify with nothing to change makes no call at all
+    edit_kwargs: Dict[str, Any] = {}
+    if member.nick != new_nick:
+        edit_kwargs["nick"] = new_nick
+    if remove_roles or actual_add_roles:
+        edit_kwargs["roles"] = [
+            r for r in member.roles if not r.is_default() and r not in remove_roles
+        ] + actual_add_roles
+
+    if not edit_kwargs:
+        return add_roles
+
     try:
-        if remove_roles:
-            await member.remove_roles(*remove_roles, reason="Verified via WildApricot")
-        if actual_add_roles:
-            await member.add_roles(*actual_add_roles, reason="Verified via WildApricot")
-    except (discord.Forbidden, discord.HTTPException):
+        await member.edit(**edit_kwargs, reason="Verified via WildApricot")
+    except discord.Forbidden:
+        # Nicknames of members above the bot can't be changed; still apply the roles
+        if "nick" in edit_kwargs and "roles" in edit_kwargs:
+            try:
+                await member.edit(roles=edit_kwargs["roles"], reason="Verified via WildApricot")
+            except (discord.Forbidden, discord.HTTPException):
+                pass
+    except discord.HTTPException:
         pass
 
     return add_roles
@@ -217,12 +330,6 @@ async def _demote_to_past_member_and_social(
         if bot_m and _can_manage_role(bot_m, r):
             to_remove.append(r)
 
-    try:
-        if to_remove:
-            await member.remove_roles(*to_remove, reason="Season re-verification enforcement")
-    except (discord.Forbidden, discord.HTTPException):
-        pass
-
     # Add required roles (if manageable)
     to_add: List[discord.Role] = []
     if role_past_member and (role_past_member not in member.roles) and (bot_m is None or _can_manage_role(bot_m, role_past_member)):
@@ -230,9 +337,14 @@ async def _demote_to_past_member_and_social(
     if role_social and (role_social not in member.roles) and (bot_m is None or _can_manage_role(bot_m, role_social)):
         to_add.append(role_social)
 
+    if not to_remove and not to_add:
+        return to_remove
+
+    # Set the target role set in one Modify Guild Member call, so the member is never
+    # left between the removal and the additions (@everyone is implicit)
+    new_roles = [r for r in member.roles if not r.is_default() and r not in to_remove] + to_add
     try:
-        if to_add:
-            await member.add_roles(*to_add, reason="Season re-verification enforcement")
+        await member.edit(roles=new_roles, reason="Season re-verification enforcement")
     except (discord.Forbidden, discord.HTTPException):
         pass
 
@@ -257,8 +369,79 @@ class VerifiedRegistry:
 
     def __init__(self, path: Path):
         self.path = path
+        # Reads don't take _lock: they never await, so they can't observe a half-applied
+        # mutation, and mutators only hold it around in-memory changes (no file I/O).
         self._lock = asyncio.Lock()
 
+        # Parsed registry, loaded on first use and kept in memory; mutations set
+        # _dirty and a debounced background task writes the file.
+        self._data: Optional[Dict[str, Any]] = None
+        self._dirty = asyncio.Event()
+        self._write_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._bulk_depth = 0
+
+        # (guild id, user id) -> present, from fetch_member fallbacks
+        self._presence_cache: TTLMap[Tuple[int, int], bool] = TTLMap(
+            MEMBER_PRESENCE_TTL_SECONDS, MEMBER_PRESENCE_MAX_ENTRIES
+        )
+
+    def _ensure_loaded(self) -> Dict[str, Any]:
+        if self._data is None:
+            self._data = self._load()
+        return self._data
+
+    def _mark_dirty(self) -> None:
+        self._dirty.set()
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flusher())
+
+    async def _flusher(self) -> None:
+        while True:
+            await self._dirty.wait()
+            # Coalesce bursts of mutations into one write; bulk passes only checkpoint
+            await asyncio.sleep(
+                REGISTRY_BULK_CHECKPOINT_SECONDS if self._bulk_depth else REGISTRY_FLUSH_DELAY_SECONDS
+            )
+            async with self._write_lock:
+                await self._write_if_dirty()
+
+    async def _write_if_dirty(self) -> None:
+        # Caller holds _write_lock, so only one write touches the tmp file at a time
+        if not self._dirty.is_set() or self._data is None:
+            return
+        self._dirty.clear()
+        # Serialize on the loop so the snapshot can't change while the thread writes it
+        payload = json.dumps(self._data, indent=2, sort_keys=True)
+        try:
+            await asyncio.to_thread(self._write_payload, payload)
+        except Exception as e:
+            log.warning("Failed to write registry JSON: %s", e)
+            self._dirty.set()
+
+    @contextlib.asynccontextmanager
+    async def bulk(self):
+        """
+        Group many mutations (e.g. an enforcement pass): while inside, the file is only
+        checkpointed every few seconds, and it is written once more on exit.
+        """
+        self._bulk_depth += 1
+        try:
+            yield self
+        finally:
+            self._bulk_depth -= 1
+            if not self._bulk_depth:
+                async with self._write_lock:
+                    await self._write_if_dirty()
+
+    async def close(self) -> None:
+        """Stop the background writer and flush any pending changes."""
+        async with self._write_lock:
+            if self._flush_task is not None:
+                self._flush_task.cancel()
+                self._flush_task = None
+            await self._write_if_dirty()
+
     def _load(self) -> Dict[str, Any]:
         if not self.path.exists():
             return {"guilds": {}}
@@ -272,13 +455,13 @@ class VerifiedRegistry:
             data.setdefault("guilds", {})
             return data
         except Exception as e:
-            print(f"[VERIFY_REGISTRY] Failed to load registry JSON: {e}")
+            log.warning("Failed to load registry JSON: %s", e)
             return {"guilds": {}}
 
-    def _atomic_write(self, data: Dict[str, Any]) -> None:
+    def _write_payload(self, payload: str) -> None:
         self.path.parent.mkdir(parents=True, exist_ok=True)
         tmp = self.path.with_suffix(self.path.suffix + ".tmp")
-        tmp.write_text(json.dumps(data, indent=2, sort_keys=True), encoding="utf-8")
+        tmp.write_text(payload, encoding="utf-8")
         tmp.replace(self.path)
 
     async def _is_member_present(self, guild: discord.Guild, user_id: int) -> bool:
@@ -286,20 +469,33 @@ class VerifiedRegistry:
         if guild.get_member(user_id) is not None:
             return True
 
+        # A chunked guild (members intent) has every member cached, so a miss means absent
+        if guild.chunked:
+            return False
+
+        key = (guild.id, user_id)
+        cached = self._presence_cache.get(key)
+        if cached is not None:
+            return cached
+
         # Fall back to API fetch (does not require privileged intents)
         try:
             await guild.fetch_member(user_id)
-            return True
+            present = True
         except discord.NotFound:
-            return False
+            present = False
         except discord.Forbidden:
             # Conservative: if we cannot verify absence, do not allow reassignment.
-            print("[VERIFY_REGISTRY] Forbidden to fetch_member; treating as present for safety.")
+            log.warning("Forbidden to fetch_member; treating as present for safety.")
             return True
         except discord.HTTPException:
-            print("[VERIFY_REGISTRY] HTTPException on fetch_member; treating as present for safety.")
+            log.warning("HTTPException on fetch_member; treating as present for safety.")
             return True
 
+        # Only definite answers are remembered; errors above are retried next time
+        self._presence_cache.set(key, present)
+        return present
+
     async def claim(
         self,
         guild: discord.Guild,
@@ -308,6 +504,7 @@ class VerifiedRegistry:
         wa_full_name: str,
         membership_level: Optional[str],
         membership_status: Optional[str],
+        wa_full_name_normalized: Optional[str] = None,
     ) -> Tuple[bool, str]:
         """
         Attempt to link wa_contact_id to discord_user.id in this guild.
@@ -316,13 +513,16 @@ class VerifiedRegistry:
         if guild is None:
             return False, "Verification must be used inside the server."
 
+        if wa_full_name_normalized is None:
+            wa_full_name_normalized = _norm_name(wa_full_name)
+
         gid = str(guild.id)
         wa_key = str(wa_contact_id)
         duid = str(discord_user.id)
-        now = _utcnow().isoformat(timespec="seconds").replace("+00:00", "Z")
+        now = _iso_now()
 
         async with self._lock:
-            data = self._load()
+            data = self._ensure_loaded()
             g = data["guilds"].setdefault(gid, {})
             wa_map = g.setdefault("wa_id_map", {})              # wa_id -> record
             user_map = g.setdefault("discord_user_map", {})     # discord_user_id -> wa_id
@@ -345,14 +545,15 @@ class VerifiedRegistry:
                     "discord_name": getattr(discord_user, "name", None),
                     "discord_global_name": getattr(discord_user, "global_name", None),
                     "wa_full_name": wa_full_name,
+                    "wa_full_name_normalized": wa_full_name_normalized,
                     "membership_level": membership_level,
                     "membership_status": membership_status,
                     "first_verified_at_utc": now,
                     "last_verified_at_utc": now,
                 }
                 user_map[duid] = wa_key
-                self._atomic_write(data)
-                print(f"[VERIFY_REGISTRY] Linked wa_id={wa_key} -> discord_user_id={duid} (new)")
+                self._mark_dirty()
+                log.info("Linked wa_id=%s -> discord_user_id=%s (new)", wa_key, duid)
                 return True, "OK"
 
             # Existing mapping: allow same account to re-verify (update info)
@@ -363,23 +564,25 @@ class VerifiedRegistry:
                     "discord_name": getattr(discord_user, "name", None),
                     "discord_global_name": getattr(discord_user, "global_name", None),
                     "wa_full_name": wa_full_name,
+                    "wa_full_name_normalized": wa_full_name_normalized,
                     "membership_level": membership_level,
                     "membership_status": membership_status,
                     "last_verified_at_utc": now,
                 })
                 wa_map[wa_key] = existing
                 user_map[duid] = wa_key
-                self._atomic_write(data)
-                print(f"[VERIFY_REGISTRY] Linked wa_id={wa_key} -> discord_user_id={duid} (re-verify)")
+                self._mark_dirty()
+                log.info("Linked wa_id=%s -> discord_user_id=%s (re-verify)", wa_key, duid)
                 return True, "OK"
 
             # Existing mapping points to a different Discord account:
             # Only block if that account is still in the guild.
             present = await self._is_member_present(guild, existing_duid)
             if present:
-                print(
-                    f"[VERIFY_REGISTRY] Reject: wa_id={wa_key} already linked to discord_user_id={existing_duid} "
-                    f"(still in guild). Attempt by discord_user_id={duid}"
+                log.info(
+                    "Reject: wa_id=%s already linked to discord_user_id=%s (still in guild). "
+                    "Attempt by discord_user_id=%s",
+                    wa_key, existing_duid, duid,
                 )
                 return (
                     False,
@@ -395,6 +598,7 @@ class VerifiedRegistry:
                 "discord_name": getattr(discord_user, "name", None),
                 "discord_global_name": getattr(discord_user, "global_name", None),
                 "wa_full_name": wa_full_name,
+                "wa_full_name_normalized": wa_full_name_normalized,
                 "membership_level": membership_level,
                 "membership_status": membership_status,
                 "first_verified_at_utc": existing.get("first_verified_at_utc", now),
@@ -404,76 +608,82 @@ class VerifiedRegistry:
                 "restorable_role_ids": existing.get("restorable_role_ids", []),
             }
             user_map[duid] = wa_key
-            self._atomic_write(data)
-            print(
-                f"[VERIFY_REGISTRY] Linked wa_id={wa_key} -> discord_user_id={duid} (reassigned; "
-                f"previous discord_user_id={existing_duid} not in guild)"
+            self._mark_dirty()
+            log.info(
+                "Linked wa_id=%s -> discord_user_id=%s (reassigned; previous discord_user_id=%s not in guild)",
+                wa_key, duid, existing_duid,
             )
             return True, "OK"
 
-    async def list_wa_records(self, guild_id: int) -> Dict[str, Dict[str, Any]]:
-        gid = str(guild_id)
-        async with self._lock:
-            data = self._load()
-            g = data.get("guilds", {}).get(gid, {})
-            wa_map = g.get("wa_id_map", {}) or {}
-            # return a shallow copy to avoid accidental mutation without lock
-            return {k: (v.copy() if isinstance(v, dict) else {}) for k, v in wa_map.items()}
+    async def get_wa_record(self, guild_id: int, wa_contact_id: int) -> Optional[Dict[str, Any]]:
+        data = self._ensure_loaded()
+        g = data.get("guilds", {}).get(str(guild_id), {})
+        rec = (g.get("wa_id_map", {}) or {}).get(str(wa_contact_id))
+        return rec.copy() if isinstance(rec, dict) else None
+
+    async def list_wa_records_readonly(self, guild_id: int) -> Mapping[str, Dict[str, Any]]:
+        """
+        Zero-copy read-only view of a guild's records for scans. The view is live:
+        snapshot its items before awaiting mid-iteration, and never mutate the records.
+        """
+        data = self._ensure_loaded()
+        g = data.get("guilds", {}).get(str(guild_id), {})
+        return MappingProxyType(g.get("wa_id_map", {}) or {})
 
     async def update_wa_record(self, guild_id: int, wa_contact_id: int, updates: Dict[str, Any]) -> None:
         gid = str(guild_id)
         wa_key = str(wa_contact_id)
         async with self._lock:
-            data = self._load()
+            data = self._ensure_loaded()
             g = data["guilds"].setdefault(gid, {})
             wa_map = g.setdefault("wa_id_map", {})
             rec = wa_map.get(wa_key)
             if isinstance(rec, dict):
                 rec.update(updates)
                 wa_map[wa_key] = rec
-                self._atomic_write(data)
+                self._mark_dirty()
+
+    async def get_season_state(self, season_year: int) -> Dict[int, Dict[str, bool]]:
+        """Per-guild {"dm_sent": bool, "enforced": bool} for a season, for every guild on record."""
+        data = self._ensure_loaded()
+        year_key = str(season_year)
+        state: Dict[int, Dict[str, bool]] = {}
+        for gid, g in data.get("guilds", {}).items():
+            rec = (g.get("season_state", {}) or {}).get(year_key, {}) or {}
+            state[int(gid)] = {
+                "dm_sent": bool(rec.get("dm_sent_at_utc")),
+                "enforced": bool(rec.get("enforced_at_utc")),
+            }
+        return state
 
-    async def _get_season_state(self, data: Dict[str, Any], gid: str) -> Dict[str, Any]:
-        g = data["guilds"].setdefault(gid, {})
-        return g.setdefault("season_state", {})
+    def _mark_season(self, guild_id: int, season_year: int, field: str) -> None:
+        # One in-memory update with no await, so it can't interleave with other mutators
+        now = _iso_now()
+        data = self._ensure_loaded()
+        data["guilds"].setdefault(str(guild_id), {}).setdefault("season_state", {}).setdefault(
+            str(season_year), {}
+        )[field] = now
+        self._mark_dirty()
 
     async def was_dm_sent(self, guild_id: int, season_year: int) -> bool:
         gid = str(guild_id)
-        async with self._lock:
-            data = self._load()
-            season_state = data.get("guilds", {}).get(gid, {}).get("season_state", {}) or {}
-            rec = season_state.get(str(season_year), {}) or {}
-            return bool(rec.get("dm_sent_at_utc"))
+        data = self._ensure_loaded()
+        season_state = data.get("guilds", {}).get(gid, {}).get("season_state", {}) or {}
+        rec = season_state.get(str(season_year), {}) or {}
+        return bool(rec.get("dm_sent_at_utc"))
 
     async def mark_dm_sent(self, guild_id: int, season_year: int) -> None:
-        gid = str(guild_id)
-        now = _utcnow().isoformat(timespec="seconds").replace("+00:00", "Z")
-        async with self._lock:
-            data = self._load()
-            season_state = data["guilds"].setdefault(gid, {}).setdefault("season_state", {})
-            rec = season_state.setdefault(str(season_year), {})
-            rec["dm_sent_at_utc"] = now
-            season_state[str(season_year)] = rec
-            self._atomic_write(data)
+        self._mark_season(guild_id, season_year, "dm_sent_at_utc")
 
     async def was_enforced(self, guild_id: int, season_year: int) -> bool:
         gid = str(guild_id)
-        async with self._lock:
-            data = self._load()
-            season_state = data.get("guilds", {}).get(gid, {}).get("season_state", {}) or {}
-            rec = season_state.get(str(season_year), {}) or {}
-            return bool(rec.get("enforced_at_utc"))
+        data = self._ensure_loaded()
+        season_state = data.get("guilds", {}).get(gid, {}).get("season_state", {}) or {}
+        rec = season_state.get(str(season_year), {}) or {}
+        return bool(rec.get("enforced_at_utc"))
 
     async def mark_enforced(self, guild_id: int, season_year: int) -> None:
-        gid = str(guild_id)
-        now = _utcnow().isoformat(timespec="seconds").replace("+00:00", "Z")
-        async with self._lock:
-            data = self._load()
-            season_state = data["guilds"].setdefault(gid, {}).setdefault("season_state", {})
-            rec = season_state.setdefault(str(season_year), {})
-            rec["enforced_at_utc"] = now
-            season_state[str(season_year)] = rec
-            self._atomic_write(data)
+        self._mark_season(guild_id, season_year, "enforced_at_utc")
 
 
 # -------------------- WildApricot client --------------------
@@ -493,12 +703,29 @@ class WildApricotClient:
         self.api_version = api_version
 
         self._token: Optional[str] = None
-        self._token_expiry_utc: Optional[dt.datetime] = None
+        self._token_lock = asyncio.Lock()
+        # time.monotonic() after which the token must be refreshed (30s before it expires)
+        self._token_expiry_mono = 0.0
         self._session: Optional[aiohttp.ClientSession] = None
+        # contact id -> contact payload
+        self._contact_cache: TTLMap[int, Dict[str, Any]] = TTLMap(
+            WA_CONTACT_CACHE_TTL_SECONDS, WA_CONTACT_CACHE_MAX_ENTRIES
+        )
 
     async def start(self) -> None:
         if self._session is None:
-            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=20))
+            # Every request goes to the same two hosts; keep connections and DNS warm
+            connector = aiohttp.TCPConnector(
+                limit=20,
+                limit_per_host=10,
+                ttl_dns_cache=300,
+                keepalive_timeout=60,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=20),
+                headers={"User-Agent": "BlackbeardBot"},
+            )
 
     async def close(self) -> None:
         if self._session is not None:
@@ -506,10 +733,16 @@ class WildApricotClient:
             self._session = None
 
     async def _ensure_token(self) -> str:
-        if self._token and self._token_expiry_utc:
-            if dt.datetime.utcnow() < (self._token_expiry_utc - dt.timedelta(seconds=30)):
+        if self._token and time.monotonic() < self._token_expiry_mono:
+            return self._token
+
+        # Concurrent callers (e.g. the enforcement fan-out) share one refresh
+        async with self._token_lock:
+            if self._token and time.monotonic() < self._token_expiry_mono:
                 return self._token
+            return await self._refresh_token()
 
+    async def _refresh_token(self) -> str:
         if self._session is None:
             raise RuntimeError("WildApricotClient not started (session is None)")
 
@@ -529,13 +762,17 @@ class WildApricotClient:
 
         expires_in = int(payload.get("expires_in", 3600))
         self._token = token
-        self._token_expiry_utc = dt.datetime.utcnow() + dt.timedelta(seconds=expires_in)
+        self._token_expiry_mono = time.monotonic() + expires_in - 30
         return token
 
     async def get_contact(self, contact_id: int) -> Dict[str, Any]:
         if self._session is None:
             raise RuntimeError("WildApricotClient not started (session is None)")
 
+        cached = self._contact_cache.get(contact_id)
+        if cached is not None:
+            return cached
+
         token = await self._ensure_token()
         url = f"{self.API_BASE}/{self.api_version}/accounts/{self.account_id}/contacts/{contact_id}"
         headers = {"Authorization": f"Bearer {token}"}
@@ -546,7 +783,10 @@ class WildApricotClient:
             text = await resp.text()
             if resp.status != 200:
                 raise RuntimeError(f"WA contact lookup failed: HTTP {resp.status} body={text[:300]}")
-            return await resp.json()
+            contact = await resp.json()
+
+        self._contact_cache.set(contact_id, contact)
+        return contact
 
 
 # -------------------- UI: modal + view --------------------
@@ -591,7 +831,7 @@ class VerifyModal(discord.ui.Modal, title="Member Verification"):
         try:
             contact = await self.wa.get_contact(contact_id)
         except Exception as e:
-            print(f"[VERIFY][WA_ERROR] user={interaction.user} id={contact_id} err={e}")
+            log.warning("WA lookup failed: user=%s id=%s err=%s", interaction.user, contact_id, e)
             await interaction.followup.send(
                 "Verification service error. Please try again later.",
                 ephemeral=True,
@@ -605,7 +845,7 @@ class VerifyModal(discord.ui.Modal, title="Member Verification"):
         )
 
         if not contact:
-            print(f"[VERIFY] user={interaction.user} id={contact_id} NOT_FOUND input_name={name_val!r}")
+            log.info("user=%s id=%s NOT_FOUND input_name=%r", interaction.user, contact_id, name_val)
             await interaction.followup.send(failure_msg, ephemeral=True)
             return
 
@@ -613,32 +853,18 @@ class VerifyModal(discord.ui.Modal, title="Member Verification"):
         wa_last = (contact.get("LastName") or "").strip()
         wa_full = f"{wa_first} {wa_last}".strip()
 
-        # Membership status
-        status = contact.get("Status")
-        if not status:
-            for fv in contact.get("FieldValues", []) or []:
-                if (fv.get("FieldName") or "").strip().lower() == "membership status":
-                    status = fv.get("Value")
-                    break
+        status, membership_level = _membership_status_and_level(contact)
         status_norm = (status or "").strip().lower()
 
-        # Membership level
-        membership_level = None
-        ml = contact.get("MembershipLevel")
-        if isinstance(ml, dict):
-            membership_level = ml.get("Name")
-        if not membership_level:
-            for fv in contact.get("FieldValues", []) or []:
-                if (fv.get("FieldName") or "").strip().lower() == "membership level":
-                    membership_level = fv.get("Value")
-                    break
+        # Normalized once here; claim() stores it for workhours' duplicate-name scan
+        wa_full_norm = _norm_name(wa_full)
 
-        match = _norm_name(name_val) == _norm_name(wa_full)
+        match = _norm_name(name_val) == wa_full_norm
 
-        print(
-            f"[VERIFY] user={interaction.user} ({interaction.user.id}) "
-            f"input_name={name_val!r} input_member_id={contact_id} "
-            f"wa_name={wa_full!r} wa_status={status!r} wa_level={membership_level!r} match={match}"
+        log.info(
+            "user=%s (%s) input_name=%r input_member_id=%s wa_name=%r wa_status=%r wa_level=%r match=%s",
+            interaction.user, interaction.user.id, name_val, contact_id,
+            wa_full, status, membership_level, match,
         )
 
         # Must match AND be Active
@@ -658,6 +884,7 @@ class VerifyModal(discord.ui.Modal, title="Member Verification"):
             wa_contact_id=contact_id,
             discord_user=interaction.user,
             wa_full_name=wa_full,
+            wa_full_name_normalized=wa_full_norm,
             membership_level=membership_level,
             membership_status=status,
         )
@@ -724,10 +951,24 @@ class VerifyCog(commands.Cog):
 
         self.view = VerifyView(wa, self.registry)
 
+        # Shared pacing for the season passes: DMs are limited bot-wide, member
+        # fetches/edits per guild (see _member_pacer_for)
+        self._dm_pacer = Pacer(SEASON_DM_RATE_PER_SEC)
+        self._member_pacers: Dict[int, Pacer] = {}
+        # (guild id, season year) of enforcement passes in progress, so a reconnect's
+        # catch-up can't start a second pass over the same guild
+        self._enforcing: Set[Tuple[int, int]] = set()
+
         self._lock = asyncio.Lock()
         self._bootstrapped = False
         self._season_tasks_started = False
 
+    def _member_pacer_for(self, guild: discord.Guild) -> Pacer:
+        pacer = self._member_pacers.get(guild.id)
+        if pacer is None:
+            pacer = self._member_pacers[guild.id] = Pacer(ENFORCE_MEMBER_RATE_PER_SEC)
+        return pacer
+
     def _build_embed(self) -> discord.Embed:
         return discord.Embed(
             title="Member Verification",
@@ -745,7 +986,7 @@ class VerifyCog(commands.Cog):
                 return {}
             return json.loads(raw)
         except Exception as e:
-            print(f"[VERIFY] Failed to load state: {e}")
+            log.warning("Failed to load state: %s", e)
             return {}
 
     def _save_state(self, guild_id: int, channel_id: int, message_id: int) -> None:
@@ -782,7 +1023,7 @@ class VerifyCog(commands.Cog):
 
             ch = await self._find_target_channel()
             if ch is None:
-                print(f"[VERIFY] Could not find channel named #{config.VERIFY_CHANNEL_NAME}")
+                log.warning("Could not find channel named #%s", config.VERIFY_CHANNEL_NAME)
                 return
 
             state = self._load_state()
@@ -793,30 +1034,27 @@ class VerifyCog(commands.Cog):
                 try:
                     msg = await ch.fetch_message(mid)
                     await msg.edit(embed=self._build_embed(), view=self.view)
-                    self._save_state(ch.guild.id, ch.id, msg.id)
-                    print(f"[VERIFY] Using existing verify message_id={msg.id} in #{ch.name}")
+                    await asyncio.to_thread(self._save_state, ch.guild.id, ch.id, msg.id)
+                    log.info("Using existing verify message_id=%s in #%s", msg.id, ch.name)
                     return
                 except discord.NotFound:
-                    print("[VERIFY] Previous verify message not found (deleted). Creating a new one.")
+                    log.info("Previous verify message not found (deleted). Creating a new one.")
                 except Exception as e:
-                    print(f"[VERIFY] Failed to fetch/edit previous verify message: {e}")
+                    log.warning("Failed to fetch/edit previous verify message: %s", e)
 
             # Otherwise create a new verify message
             try:
                 msg = await ch.send(embed=self._build_embed(), view=self.view)
-                self._save_state(ch.guild.id, ch.id, msg.id)
-                print(f"[VERIFY] Created new verify message_id={msg.id} in #{ch.name}")
+                await asyncio.to_thread(self._save_state, ch.guild.id, ch.id, msg.id)
+                log.info("Created new verify message_id=%s in #%s", msg.id, ch.name)
             except Exception as e:
-                print(f"[VERIFY] Failed to create verify message in #{ch.name}: {e}")
+                log.warning("Failed to create verify message in #%s: %s", ch.name, e)
 
-    async def _dm_all_members_for_season(self, guild: discord.Guild, season_year: int) -> None:
-        # Avoid duplicates
-        if await self.registry.was_dm_sent(guild.id, season_year):
+    async def _dm_all_members_for_season(self, guild: discord.Guild, season_year: int, *, checked: bool = False) -> None:
+        # Avoid duplicates (checked=True: the caller already consulted the season state)
+        if not checked and await self.registry.was_dm_sent(guild.id, season_year):
             return
 
-        sent = 0
-        failed = 0
-
         # Resolve channel links
         verify_ch = discord.utils.get(guild.text_channels, name=config.VERIFY_CHANNEL_NAME)
         verify_mention = f"<#{verify_ch.id}> (https://discord.com/channels/{guild.id}/{verify_ch.id})" if verify_ch else f"#{config.VERIFY_CHANNEL_NAME}"
@@ -830,143 +1068,197 @@ class VerifyCog(commands.Cog):
             roles_channel=roles_mention
         )
 
-        for m in guild.members:
-            if m.bot:
-                continue
-            try:
-                await m.send(dm_text)
-                sent += 1
-            except discord.Forbidden:
-                failed += 1
-            except discord.HTTPException:
-                failed += 1
-
-            # Gentle pacing to reduce rate-limit pressure
-            await asyncio.sleep(1.0)
-
-        await self.registry.mark_dm_sent(guild.id, season_year)
-        print(f"[SEASON] DM sent for season_year={season_year} in guild={guild.id} (sent={sent}, failed={failed})")
-
-    async def _enforce_reverify_for_season(self, guild: discord.Guild, season_year: int) -> None:
-        # Avoid duplicates
-        if await self.registry.was_enforced(guild.id, season_year):
-            return
-
-        season_start = _season_start_utc(season_year)
-
-        role_social = _get_role(guild, getattr(config, "ROLE_SOCIAL", "social"))
-        role_past_member = _get_role(guild, getattr(config, "ROLE_PAST_MEMBER", "past member"))
-
-        wa_records = await self.registry.list_wa_records(guild.id)
+        sem = asyncio.Semaphore(SEASON_DM_CONCURRENCY)
 
-        demoted = 0
-        skipped_absent = 0
-        already_ok = 0
+        async def _dm_one(m: discord.Member) -> bool:
+            async with sem:
+                await self._dm_pacer.wait()
+                try:
+                    await m.send(dm_text)
+                    return True
+                except (discord.Forbidden, discord.HTTPException):
+                    return False
 
-        for wa_id_str, rec in wa_records.items():
-            if not isinstance(rec, dict):
-                continue
+        results = await asyncio.gather(*(_dm_one(m) for m in guild.members if not m.bot))
+        sent = sum(results)
+        failed = len(results) - sent
 
-            duid = rec.get("discord_user_id")
-            if not isinstance(duid, int):
-                continue
+        await self.registry.mark_dm_sent(guild.id, season_year)
+        log.info("Season DM sent for season_year=%s in guild=%s (sent=%s, failed=%s)", season_year, guild.id, sent, failed)
 
-            # Only block/demote if the linked Discord user is still in the server
-            member = guild.get_member(duid)
-            if member is None:
+    async def _enforce_one(
+        self,
+        guild: discord.Guild,
+        season_year: int,
+        duid: int,
+        rec: Dict[str, Any],
+        role_past_member: Optional[discord.Role],
+        role_social: Optional[discord.Role],
+        fetched: Dict[int, Optional[discord.Member]],
+    ) -> str:
+        """
+        Enforce re-verification for one record not yet verified this season.
+        Returns "demoted", "already_ok" (renewed on WA), "skipped_absent", or "error"
+        (WA lookup failed; nothing is changed and the season is retried later).
+        """
+        # Only block/demote if the linked Discord user is still in the server
+        member = guild.get_member(duid)
+        if member is None:
+            # A chunked guild has every member cached, so a miss means they left
+            if guild.chunked:
+                return "skipped_absent"
+            if duid in fetched:
+                member = fetched[duid]
+            else:
+                await self._member_pacer_for(guild).wait()
                 try:
                     member = await guild.fetch_member(duid)
                 except discord.NotFound:
-                    skipped_absent += 1
-                    continue
+                    member = None
                 except (discord.Forbidden, discord.HTTPException):
                     # Conservative: if we cannot confirm, skip demotion for this record
-                    skipped_absent += 1
-                    continue
-
-            last_v = _parse_utc_iso(rec.get("last_verified_at_utc"))
-            if last_v and last_v >= season_start:
-                already_ok += 1
-                continue
+                    member = None
+                # The same user can back several records; fetch them once per pass
+                fetched[duid] = member
+            if member is None:
+                return "skipped_absent"
 
-            # If they haven't re-verified on Discord yet, check WildApricot to see if they are already active for the new season
-            contact_id = rec.get("wa_contact_id")
-            is_active_on_wa = False
-            status = None
-            membership_level = None
+        # If they haven't re-verified on Discord yet, check WildApricot to see if they are already active for the new season
+        contact_id = rec.get("wa_contact_id")
+        is_active_on_wa = False
+        status = None
+        membership_level = None
 
-            if isinstance(contact_id, int):
+        if isinstance(contact_id, int):
+            for attempt in range(1, WA_LOOKUP_ATTEMPTS + 1):
                 try:
                     contact = await self.wa.get_contact(contact_id)
-                    if contact:
-                        # Extract membership status
-                        status = contact.get("Status")
-                        if not status:
-                            for fv in contact.get("FieldValues", []) or []:
-                                if (fv.get("FieldName") or "").strip().lower() == "membership status":
-                                    status = fv.get("Value")
-                                    break
-                        status_norm = (status or "").strip().lower()
-
-                        if status_norm == "active":
-                            is_active_on_wa = True
-                            # Also pull updated membership level if any
-                            ml = contact.get("MembershipLevel")
-                            if isinstance(ml, dict):
-                                membership_level = ml.get("Name")
-                            if not membership_level:
-                                for fv in contact.get("FieldValues", []) or []:
-                                    if (fv.get("FieldName") or "").strip().lower() == "membership level":
-                                        membership_level = fv.get("Value")
-                                        break
+                    break
                 except Exception as e:
-                    print(f"[SEASON][WA_ERROR] Failed to check status for contact_id={contact_id} during enforcement: {e}")
-
-            if is_active_on_wa:
-                # User is active on WA! Automatically renew their verification for this season
-                now_str = _utcnow().isoformat(timespec="seconds").replace("+00:00", "Z")
-                await self.registry.update_wa_record(
-                    guild_id=guild.id,
-                    wa_contact_id=contact_id,
-                    updates={
-                        "last_verified_at_utc": now_str,
-                        "membership_level": membership_level,
-                        "membership_status": status,
-                    }
-                )
-                already_ok += 1
-                print(f"[SEASON] Auto-renewed active member wa_id={contact_id} (discord={duid}) without demotion")
-                continue
-
-            # Not re-verified this season: demote
-            removed_roles = await _demote_to_past_member_and_social(
-                bot=self.bot,
-                member=member,
-                role_past_member=role_past_member,
-                role_social=role_social,
+                    log.warning(
+                        "Failed to check WA status for contact_id=%s during enforcement (attempt %d/%d): %s",
+                        contact_id, attempt, WA_LOOKUP_ATTEMPTS, e,
+                    )
+                    if attempt < WA_LOOKUP_ATTEMPTS:
+                        await asyncio.sleep(WA_LOOKUP_RETRY_DELAY_SECONDS * attempt)
+            else:
+                # Never demote on an unknown WA status; a renewed member would lose their roles
+                return "error"
+            if contact:
+                # Extract membership status (and updated membership level, if any)
+                status, membership_level = _membership_status_and_level(contact)
+                is_active_on_wa = (status or "").strip().lower() == "active"
+
+        if is_active_on_wa:
+            # User is active on WA! Automatically renew their verification for this season
+            now_str = _iso_now()
+            await self.registry.update_wa_record(
+                guild_id=guild.id,
+                wa_contact_id=contact_id,
+                updates={
+                    "last_verified_at_utc": now_str,
+                    "membership_level": membership_level,
+                    "membership_status": status,
+                }
             )
-            demoted += 1
+            log.info("Auto-renewed active member wa_id=%s (discord=%s) without demotion", contact_id, duid)
+            return "already_ok"
+
+        # Not re-verified this season: demote
+        await self._member_pacer_for(guild).wait()
+        removed_roles = await _demote_to_past_member_and_social(
+            bot=self.bot,
+            member=member,
+            role_past_member=role_past_member,
+            role_social=role_social,
+        )
 
-            # Record demotion metadata (optional but useful)
-            demotion_updates = {
-                "demoted_for_season_year": season_year,
-                "demoted_at_utc": _utcnow().isoformat(timespec="seconds").replace("+00:00", "Z"),
-            }
-            if removed_roles:
-                demotion_updates["restorable_role_ids"] = [r.id for r in removed_roles]
+        # Record demotion metadata (optional but useful)
+        demotion_updates = {
+            "demoted_for_season_year": season_year,
+            "demoted_at_utc": _iso_now(),
+        }
+        if removed_roles:
+            demotion_updates["restorable_role_ids"] = [r.id for r in removed_roles]
+
+        await self.registry.update_wa_record(
+            guild_id=guild.id,
+            wa_contact_id=int(rec.get("wa_contact_id", 0) or 0),
+            updates=demotion_updates,
+        )
+        return "demoted"
 
-            await self.registry.update_wa_record(
-                guild_id=guild.id,
-                wa_contact_id=int(rec.get("wa_contact_id", 0) or 0),
-                updates=demotion_updates,
+    async def _enforce_reverify_for_season(self, guild: discord.Guild, season_year: int, *, checked: bool = False) -> None:
+        # Avoid duplicates (checked=True: the caller already consulted the season state)
+        if not checked and await self.registry.was_enforced(guild.id, season_year):
+            return
+
+        pass_key = (guild.id, season_year)
+        if pass_key in self._enforcing:
+            return
+        self._enforcing.add(pass_key)
+        try:
+            await self._run_enforcement_pass(guild, season_year)
+        finally:
+            self._enforcing.discard(pass_key)
+
+    async def _run_enforcement_pass(self, guild: discord.Guild, season_year: int) -> None:
+        season_start = _season_start_utc(season_year)
+        season_start_iso = season_start.isoformat(timespec="seconds").replace("+00:00", "Z")
+
+        role_social = _get_role(guild, ROLE_SOCIAL_NAME)
+        role_past_member = _get_role(guild, ROLE_PAST_MEMBER_NAME)
+
+        # Normally done at startup (chunk_guilds_at_startup); makes get_member authoritative
+        if not guild.chunked:
+            try:
+                await guild.chunk(cache=True)
+            except (discord.ClientException, discord.HTTPException) as e:
+                log.warning("Could not chunk guild=%s; falling back to fetch_member: %s", guild.id, e)
+
+        sem = asyncio.Semaphore(ENFORCE_CONCURRENCY)
+        fetched: Dict[int, Optional[discord.Member]] = {}
+
+        async def _bounded(duid: int, rec: Dict[str, Any]) -> str:
+            async with sem:
+                return await self._enforce_one(
+                    guild, season_year, duid, rec, role_past_member, role_social, fetched
+                )
+
+        async with self.registry.bulk():
+            wa_records = await self.registry.list_wa_records_readonly(guild.id)
+
+            # Partition before any I/O (also snapshots the live view, which verifies may grow)
+            counts: Dict[str, int] = {}
+            candidates: List[Tuple[int, Dict[str, Any]]] = []
+            for rec in list(wa_records.values()):
+                duid = rec.get("discord_user_id") if isinstance(rec, dict) else None
+                if not isinstance(duid, int):
+                    counts["malformed"] = counts.get("malformed", 0) + 1
+                elif _verified_since(rec.get("last_verified_at_utc"), season_start, season_start_iso):
+                    counts["already_ok"] = counts.get("already_ok", 0) + 1
+                else:
+                    candidates.append((duid, rec))
+
+            results = await asyncio.gather(
+                *(_bounded(duid, rec) for duid, rec in candidates),
+                return_exceptions=True,
             )
 
-            await asyncio.sleep(0.5)
+            for r in results:
+                if isinstance(r, BaseException):
+                    log.error("Enforcement failed for a record in guild=%s", guild.id, exc_info=r)
+                    r = "error"
+                counts[r] = counts.get(r, 0) + 1
 
-        await self.registry.mark_enforced(guild.id, season_year)
-        print(
-            f"[SEASON] Enforced for season_year={season_year} in guild={guild.id} "
-            f"(demoted={demoted}, already_ok={already_ok}, skipped_absent={skipped_absent})"
+            # Leave the season unmarked on errors so catch-up retries it (the pass is idempotent)
+            if not counts.get("error"):
+                await self.registry.mark_enforced(guild.id, season_year)
+
+        log.info(
+            "Season enforced for season_year=%s in guild=%s (demoted=%s, already_ok=%s, skipped_absent=%s, errors=%s)",
+            season_year, guild.id, counts.get("demoted", 0), counts.get("already_ok", 0),
+            counts.get("skipped_absent", 0), counts.get("error", 0),
         )
 
     async def _season_catchup(self) -> None:
@@ -984,16 +1276,28 @@ class VerifyCog(commands.Cog):
         dm_announce_dt = dt.datetime.combine(season_start.date(), DM_ANNOUNCE_TIME_UTC, tzinfo=UTC)
         enforce_dt = dt.datetime.combine(deadline.date(), ENFORCE_TIME_UTC, tzinfo=UTC)
 
+        # The two windows don't overlap, so each guild gets at most one job. Guilds run
+        # concurrently, but DMs share one bot-wide pacer and WA lookups one account, so
+        # only the per-guild member fetches/edits actually overlap across guilds
+        season_state = await self.registry.get_season_state(year)
+        jobs = []
         for g in self.bot.guilds:
+            g_state = season_state.get(g.id, {})
+
             # DM catchup window
             if dm_announce_dt <= now < deadline:
-                if not await self.registry.was_dm_sent(g.id, year):
-                    await self._dm_all_members_for_season(g, year)
+                if not g_state.get("dm_sent"):
+                    jobs.append(self._dm_all_members_for_season(g, year, checked=True))
 
             # Enforcement catchup
             if now >= enforce_dt:
-                if not await self.registry.was_enforced(g.id, year):
-                    await self._enforce_reverify_for_season(g, year)
+                if not g_state.get("enforced"):
+                    jobs.append(self._enforce_reverify_for_season(g, year, checked=True))
+
+        results = await asyncio.gather(*jobs, return_exceptions=True)
+        for r in results:
+            if isinstance(r, BaseException):
+                log.error("Season catch-up failed for a guild", exc_info=r)
 
     @tasks.loop(time=DM_ANNOUNCE_TIME_UTC)
     async def season_dm_loop(self) -> None:
@@ -1017,9 +1321,25 @@ class VerifyCog(commands.Cog):
         for g in self.bot.guilds:
             await self._enforce_reverify_for_season(g, season_year)
 
+    async def cog_unload(self) -> None:
+        await self.registry.close()
+
+    @commands.Cog.listener()
+    async def on_guild_role_create(self, role: discord.Role):
+        _role_id_cache.pop(role.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role):
+        if before.name != after.name:
+            _role_id_cache.pop(after.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role):
+        _role_id_cache.pop(role.guild.id, None)
+
     @commands.Cog.listener()
     async def on_ready(self):
-        print("[VerifyCog] ready")
+        log.info("VerifyCog ready")
         await self.ensure_verify_message()
 
         # Start season loops once
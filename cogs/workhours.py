@@ -16,11 +16,15 @@ log = logging.getLogger(__name__)
 
 # -------------------- helper functions --------------------
 
+_NORM_PUNCT = re.compile(r"[^a-z0-9\s]+")
+_NORM_SPACE = re.compile(r"\s+")
+
+
 def _norm_name(s: str) -> str:
     """Normalize names to match string equality robust to spacing, punctuation, and casing."""
     s = (s or "").strip().lower()
-    s = re.sub(r"[^a-z0-9\s]+", " ", s)  # drop punctuation
-    s = re.sub(r"\s+", " ", s).strip()
+    s = _NORM_PUNCT.sub(" ", s)  # drop punctuation
+    s = _NORM_SPACE.sub(" ", s).strip()
     return s
 
 
@@ -106,7 +110,7 @@ class WorkhoursCog(commands.Cog):
 
         registry = verify_cog.registry
         async with registry._lock:
-            data = registry._load()
+            data = registry._ensure_loaded()
             guilds = data.get("guilds", {})
 
             # 1. Search specified guild first if available
@@ -161,14 +165,15 @@ class WorkhoursCog(commands.Cog):
                     # Update name in registry for all guilds where user is mapped to this contact ID
                     registry = verify_cog.registry
                     async with registry._lock:
-                        data = registry._load()
+                        data = registry._ensure_loaded()
                         for gid, g in data.get("guilds", {}).items():
                             user_map = g.get("discord_user_map", {})
                             wa_map = g.get("wa_id_map", {})
                             if user_map.get(str(user_id)) == str(wa_contact_id):
                                 wa_rec = wa_map.setdefault(str(wa_contact_id), {})
                                 wa_rec["wa_full_name"] = wa_full
-                        registry._atomic_write(data)
+                                wa_rec["wa_full_name_normalized"] = _norm_name(wa_full)
+                        registry._mark_dirty()
                     log.info(f"WA name successfully cached in registry: {wa_full}")
                     return wa_full
         except Exception as e:
@@ -189,7 +194,7 @@ class WorkhoursCog(commands.Cog):
         target_norm = _norm_name(target_name)
 
         async with registry._lock:
-            data = registry._load()
+            data = registry._ensure_loaded()
             guilds = data.get("guilds", {})
 
             for gid, g in guilds.items():
@@ -209,7 +214,9 @@ class WorkhoursCog(commands.Cog):
                     if status != "active" or level == "social":
                         continue
 
-                    name_norm = _norm_name(record.get("wa_full_name"))
+                    name_norm = record.get("wa_full_name_normalized")
+                    if name_norm is None:
+                        name_norm = _norm_name(record.get("wa_full_name"))
                     if name_norm == target_norm:
                         log.warning(
                             f"[WORKHOURS] Duplicate name conflict found for name={target_name!r}. "
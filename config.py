@@ -1,7 +1,9 @@
 import os
-from dotenv import load_dotenv, find_dotenv
+from pathlib import Path
+from dotenv import load_dotenv
 
-load_dotenv(find_dotenv())
+# .env lives next to this file; load it directly instead of searching parent directories
+load_dotenv(Path(__file__).with_name(".env"), override=False)
 
 TOKEN = os.getenv("DISCORD_TOKEN", "")
 WA_API_KEY = os.getenv("WA_API_KEY", "")
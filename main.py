@@ -1,10 +1,16 @@
 #!/usr/bin/env python
 
+import logging
+import logging.handlers
+import queue
+
 import discord
 from discord.ext import commands
 
 import config
 
+log = logging.getLogger(__name__)
+
 
 class BlackbeardBot(commands.Bot):
     async def setup_hook(self) -> None:
@@ -16,12 +22,12 @@ class BlackbeardBot(commands.Bot):
         await self.load_extension("cogs.welcome")
 
     async def on_ready(self) -> None:
-        print(f"Logged in as {self.user} (id={self.user.id})")
+        log.info("Logged in as %s (id=%s)", self.user, self.user.id)
         try:
             synced = await self.tree.sync()
-            print(f"Synced {len(synced)} application command(s) successfully.")
+            log.info("Synced %d application command(s) successfully.", len(synced))
         except Exception as e:
-            print(f"Error syncing application commands: {e}")
+            log.warning("Error syncing application commands: %s", e)
 
 
 def build_intents() -> discord.Intents:
@@ -34,13 +40,36 @@ def build_intents() -> discord.Intents:
     return intents
 
 
+def setup_logging() -> logging.handlers.QueueListener:
+    # Handlers run on the listener's thread, so stream writes never block the event loop
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    stream = logging.StreamHandler()
+    stream.setFormatter(logging.Formatter("%(asctime)s %(levelname)-8s %(name)s: %(message)s"))
+
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    listener = logging.handlers.QueueListener(log_queue, stream, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
 def main() -> None:
+    listener = setup_logging()
     bot = BlackbeardBot(
         command_prefix="!",
         intents=build_intents(),
         help_command=None,
+        # Fill the member cache at startup (needs intents.members) so cogs can rely on
+        # guild.get_member instead of fetch_member round-trips.
+        chunk_guilds_at_startup=True,
     )
-    bot.run(config.TOKEN)
+    try:
+        # log_handler=None: discord.py's own logs go through the root queue handler too
+        bot.run(config.TOKEN, log_handler=None)
+    finally:
+        listener.stop()
 
 
 if __name__ == "__main__":
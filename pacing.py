@@ -0,0 +1,25 @@
+import asyncio
+import time
+
+
+class Pacer:
+    """
+    Spaces calls out to at most rate_per_sec, shared by any number of concurrent callers.
+
+    Each wait() reserves the next free slot and sleeps only until it comes up, so a
+    burst goes out at the configured rate instead of paying a fixed sleep per call.
+    """
+
+    def __init__(self, rate_per_sec: float):
+        if rate_per_sec <= 0:
+            raise ValueError("rate_per_sec must be positive")
+        self._interval = 1.0 / rate_per_sec
+        self._next_allowed = 0.0
+
+    async def wait(self) -> None:
+        # No await before the reservation, so concurrent callers always get distinct slots
+        now = time.monotonic()
+        slot = max(now, self._next_allowed)
+        self._next_allowed = slot + self._interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
@@ -0,0 +1,58 @@
+import time
+from typing import Dict, Generic, Optional, Tuple, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class TTLMap(Generic[K, V]):
+    """
+    Dict whose entries expire ttl seconds after they were set, holding at most maxsize.
+
+    Entries are kept in insertion order, which is also expiry order, so expired entries
+    are dropped from the front on each set() and the oldest live ones go first when full.
+    """
+
+    def __init__(self, ttl: float, maxsize: int):
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self._ttl = ttl
+        self._maxsize = maxsize
+        # key -> (monotonic expiry, value)
+        self._data: Dict[K, Tuple[float, V]] = {}
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: K) -> bool:
+        return self.get(key) is not None
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        if time.monotonic() >= entry[0]:
+            del self._data[key]
+            return default
+        return entry[1]
+
+    def set(self, key: K, value: V) -> None:
+        now = time.monotonic()
+        # Re-insert so the key moves to the back with its new expiry
+        self._data.pop(key, None)
+        while self._data:
+            oldest = next(iter(self._data))
+            if self._data[oldest][0] > now:
+                break
+            del self._data[oldest]
+        while len(self._data) >= self._maxsize:
+            del self._data[next(iter(self._data))]
+        self._data[key] = (now + self._ttl, value)
+
+    def pop(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        entry = self._data.pop(key, None)
+        if entry is None or time.monotonic() >= entry[0]:
+            return default
+        return entry[1]